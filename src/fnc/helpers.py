@@ -1,12 +1,28 @@
 from collections.abc import Iterable, Mapping, Sequence
 from decimal import Decimal
 import types
+import weakref
 
 
 number_types = (int, float, Decimal)
 
 Sentinel = object()
 
+# Iterators for builtin types which can be looked up by exact type to skip the slower abstract base
+# class and duck-typing checks in iterate().
+_iterators = {
+    dict: dict.items,
+    list: enumerate,
+    tuple: enumerate,
+    str: enumerate,
+    range: enumerate,
+}
+
+# Cache of types to whether their instances are collections so that the slower abstract base class
+# checks in iscollection() are only done once per type. Types are weakly referenced so that
+# dynamically created classes can still be garbage collected.
+_collection_types = weakref.WeakKeyDictionary()
+
 
 class _Unset(object):
     """
@@ -15,8 +31,7 @@ class _Unset(object):
     Used to differentiate between an explicit ``None`` and an unset value.
     """
 
-    def __bool__(self):  # pragma: no cover
-        return False
+    __slots__ = ()
 
 
 UNSET = _Unset()
@@ -31,6 +46,8 @@ class Container(object):
     ``set`` and unhashable items in a ``list`` and then checking both containers for existence.
     """
 
+    __slots__ = ("hashable", "unhashable")
+
     def __init__(self, values=None):
         self.hashable = set()
         self.unhashable = []
@@ -48,13 +65,16 @@ class Container(object):
         return len(self.hashable) + len(self.unhashable)
 
     def add(self, value):
-        if value in self:
-            return
-
+        """Add `value` to the container and return whether it wasn't already present."""
         try:
+            n = len(self.hashable)
             self.hashable.add(value)
+            return len(self.hashable) != n
         except TypeError:
+            if value in self.unhashable:
+                return False
             self.unhashable.append(value)
+            return True
 
     def extend(self, values):
         for value in values:
@@ -63,7 +83,14 @@ class Container(object):
 
 def iscollection(value):
     """Return whether `value` is iterable but not string or bytes."""
-    return isinstance(value, Iterable) and not isinstance(value, (str, bytes))
+    cls = type(value)
+    result = _collection_types.get(cls)
+
+    if result is None:
+        result = issubclass(cls, Iterable) and not issubclass(cls, (str, bytes))
+        _collection_types[cls] = result
+
+    return result
 
 
 def isgenerator(value):
@@ -72,11 +99,14 @@ def isgenerator(value):
 
     The purpose being to determine whether `value` will be exhausted if it is iterated over.
     """
-    return isinstance(value, types.GeneratorType) or (
-        hasattr(value, "__iter__")
-        and hasattr(value, "__next__")
-        and not hasattr(value, "__getitem__")
-    )
+    cls = type(value)
+
+    if cls is types.GeneratorType:
+        return True
+
+    # Special methods are looked up on the type by the iterator protocol so there's no need to
+    # inspect the instance.
+    return hasattr(cls, "__iter__") and hasattr(cls, "__next__") and not hasattr(cls, "__getitem__")
 
 
 def iterate(mapping):
@@ -91,6 +121,10 @@ def iterate(mapping):
       ``(key, mapping[key])`` will be used.
     - Otherwise, `iter(mapping)` will be returned.
     """
+    iterator = _iterators.get(type(mapping))
+    if iterator is not None:
+        return iterator(mapping)
+
     if isinstance(mapping, Mapping) or callable(getattr(mapping, "items", None)):
         return mapping.items()
 
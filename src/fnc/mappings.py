@@ -8,10 +8,16 @@ For functions that use :func:`get`, non-mapping object values can be selected fr
 """
 
 from collections.abc import Mapping, Sequence
+import weakref
 
-import fnc
+from .helpers import UNSET, Sentinel, isgenerator, iterate
+from .utilities import _aspath, iteratee as _iteratee
 
-from .helpers import UNSET, Sentinel, iterate
+
+# Cache of object types to the function used to get keys from them so that the slower abstract
+# base class checks are only done once per type. Types are weakly referenced so that dynamically
+# created classes can still be garbage collected.
+_type_getters = weakref.WeakKeyDictionary()
 
 
 def at(paths, obj):
@@ -35,7 +41,18 @@ def at(paths, obj):
     Returns:
         tuple
     """
-    return tuple(get(path, obj) for path in paths)
+    # This is the same as calling get() for each path but with the lookup loop inlined to avoid the
+    # function call overhead per path.
+    result = []
+    for path in paths:
+        value = obj
+        for key in _aspath(path):
+            value = _get(key, value, default=Sentinel)
+            if value is Sentinel:
+                value = None
+                break
+        result.append(value)
+    return tuple(result)
 
 
 def defaults(*objs):
@@ -54,7 +71,10 @@ def defaults(*objs):
     Returns:
         dict
     """
-    return merge(*reversed(objs))
+    result = {}
+    for obj in reversed(objs):
+        result.update(obj)
+    return result
 
 
 def get(path, obj, *, default=None):
@@ -95,8 +115,15 @@ def get(path, obj, *, default=None):
         # early from the loop and not mistakenly iterate over the default.
         sentinel = Sentinel
 
+    if isinstance(path, int) or (
+        isinstance(path, str) and path and "." not in path and "[" not in path
+    ):
+        # Fast path for single key lookups which don't need to be parsed.
+        result = _get(path, obj, default=sentinel)
+        return default if result is sentinel else result
+
     result = obj
-    for key in fnc.aspath(path):
+    for key in _aspath(path):
         result = _get(key, result, default=sentinel)
 
         if result is sentinel:
@@ -108,11 +135,17 @@ def get(path, obj, *, default=None):
 
 def _get(key, obj, *, default=UNSET):
     if isinstance(obj, dict):
-        value = _get_dict(key, obj, default=default)
-    elif not isinstance(obj, (Mapping, Sequence)) or isinstance(obj, tuple):
-        value = _get_obj(key, obj, default=default)
-    else:
+        value = obj.get(key, UNSET)
+        if value is not UNSET:
+            return value
+        value = _get_dict_int(key, obj, default=default)
+    elif type(obj) is list:
         value = _get_item(key, obj, default=default)
+    else:
+        getter = _type_getters.get(type(obj))
+        if getter is None:
+            getter = _type_getter(type(obj))
+        value = getter(key, obj, default=default)
 
     if value is UNSET:
         raise KeyError(f"Key {key!r} not found in {obj!r}")
@@ -120,25 +153,46 @@ def _get(key, obj, *, default=UNSET):
     return value
 
 
-def _get_dict(key, obj, *, default=UNSET):
-    value = obj.get(key, UNSET)
-    if value is UNSET:
-        value = default
-        if not isinstance(key, int):
-            try:
-                value = obj.get(int(key), default)
-            except Exception:
-                pass
-    return value
+def _type_getter(cls):
+    if issubclass(cls, (Mapping, Sequence)) and not issubclass(cls, tuple):
+        getter = _get_item
+    elif hasattr(cls, "__getitem__"):
+        getter = _get_obj
+    else:
+        # Objects that don't support item access (e.g. None, numbers, and most class instances)
+        # can skip straight to attribute access.
+        getter = _get_attr
+    _type_getters[cls] = getter
+    return getter
+
+
+def _get_dict_int(key, obj, *, default=UNSET):
+    # Retry a missed dict lookup using `key` as an integer so that path strings can reference
+    # integer dict-keys.
+    if not isinstance(key, int) and _maybe_int(key):
+        try:
+            return obj.get(int(key), default)
+        except Exception:
+            pass
+    return default
 
 
 def _get_item(key, obj, *, default=UNSET):
-    try:
-        return obj[key]
-    except (KeyError, TypeError, IndexError):
-        pass
+    is_sequence = type(obj) in (list, tuple)
+
+    if is_sequence and isinstance(key, int):
+        # Bounds check the index to avoid raising IndexError when it's missing.
+        return obj[key] if -len(obj) <= key < len(obj) else default
+
+    # Lists and tuples can't be indexed by strings so those keys can skip straight to being
+    # converted to an integer below.
+    if not (is_sequence and isinstance(key, str)):
+        try:
+            return obj[key]
+        except (KeyError, TypeError, IndexError):
+            pass
 
-    if not isinstance(key, int):
+    if not isinstance(key, int) and _maybe_int(key):
         try:
             return obj[int(key)]
         except (KeyError, TypeError, IndexError, ValueError):
@@ -147,17 +201,27 @@ def _get_item(key, obj, *, default=UNSET):
     return default
 
 
+def _maybe_int(key):
+    # Return whether `key` may be convertible by int(). Strings are checked for digits beforehand
+    # since raising ValueError for the common case of non-numeric string keys is comparatively slow.
+    # This only rules out strings that int() would reject so it doesn't change which keys convert.
+    return not isinstance(key, str) or key.strip().lstrip("+-").replace("_", "").isdigit()
+
+
 def _get_obj(key, obj, *, default=UNSET):
     value = _get_item(key, obj, default=UNSET)
     if value is UNSET:
-        value = default
-        try:
-            value = getattr(obj, key)
-        except AttributeError:
-            pass
+        value = _get_attr(key, obj, default=default)
     return value
 
 
+def _get_attr(key, obj, *, default=UNSET):
+    try:
+        return getattr(obj, key)
+    except AttributeError:
+        return default
+
+
 def has(path, obj):
     """
     Return whether `path` exists in `obj`.
@@ -182,11 +246,7 @@ def has(path, obj):
     Returns:
         bool: Whether `obj` has `path`.
     """
-    try:
-        get(path, obj, default=UNSET)
-        return True
-    except KeyError:
-        return False
+    return get(path, obj, default=Sentinel) is not Sentinel
 
 
 def invert(obj):
@@ -207,7 +267,8 @@ def invert(obj):
     Returns:
         dict: Inverted dictionary.
     """
-    return {value: key for key, value in iterate(obj)}
+    items = obj.items() if type(obj) is dict else iterate(obj)
+    return {value: key for key, value in items}
 
 
 def mapkeys(iteratee, obj):
@@ -226,8 +287,9 @@ def mapkeys(iteratee, obj):
     Returns:
         dict: Dictionary with mapped keys.
     """
-    iteratee = fnc.iteratee(iteratee)
-    return {iteratee(key): value for key, value in iterate(obj)}
+    iteratee = _iteratee(iteratee)
+    items = obj.items() if type(obj) is dict else iterate(obj)
+    return {iteratee(key): value for key, value in items}
 
 
 def mapvalues(iteratee, obj):
@@ -249,8 +311,9 @@ def mapvalues(iteratee, obj):
     Returns:
         dict: Dictionary with mapped values.
     """
-    iteratee = fnc.iteratee(iteratee)
-    return {key: iteratee(value) for key, value in iterate(obj)}
+    iteratee = _iteratee(iteratee)
+    items = obj.items() if type(obj) is dict else iterate(obj)
+    return {key: iteratee(value) for key, value in items}
 
 
 def merge(*objs):
@@ -293,7 +356,26 @@ def omit(keys, obj):
     Returns:
         dict: Dictionary with `keys` omitted.
     """
-    return {key: value for key, value in iterate(obj) if key not in keys}
+    if isgenerator(keys):
+        keys = tuple(keys)
+
+    if isinstance(keys, (list, tuple)):
+        # Convert to a set for faster membership checks when possible.
+        try:
+            keys = set(keys)
+        except TypeError:
+            pass
+
+    if type(obj) is dict and isinstance(keys, (set, frozenset)) and len(keys) < len(obj):
+        # Copying the dict and removing keys is faster than rebuilding it unless most of the keys
+        # are being omitted.
+        result = obj.copy()
+        for key in keys:
+            result.pop(key, None)
+        return result
+
+    items = obj.items() if type(obj) is dict else iterate(obj)
+    return {key: value for key, value in items if key not in keys}
 
 
 def pick(keys, obj):
@@ -314,6 +396,18 @@ def pick(keys, obj):
         dict: Dict containg picked properties.
     """
     result = {}
+
+    if isinstance(obj, dict):
+        # Fast path for dicts that only falls back to _get_dict_int() when a key is missing.
+        get_value = obj.get
+        for key in keys:
+            value = get_value(key, Sentinel)
+            if value is Sentinel:
+                value = _get_dict_int(key, obj, default=Sentinel)
+            if value is not Sentinel:
+                result[key] = value
+        return result
+
     for key in keys:
         value = _get(key, obj, default=Sentinel)
         if value is not Sentinel:
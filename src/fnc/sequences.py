@@ -7,14 +7,13 @@ identify them as generators. Otherwise, functions that return concrete values wi
 ``Returns`` section instead.
 """
 
-from collections import Counter, deque
-from functools import partial
+from collections import Counter, defaultdict
+from collections.abc import Sequence, Sized
 import itertools
-from operator import not_
 
 import fnc
 
-from .helpers import Container, iscollection, isgenerator
+from .helpers import Container, Sentinel, iscollection, isgenerator
 
 
 _filter = filter  # pylint: disable=used-before-assignment
@@ -39,16 +38,27 @@ def chunk(size, seq):
     if not isinstance(size, int) or size <= 0:  # pragma: no cover
         raise ValueError("size must be an integer greater than zero")
 
-    group = []
+    seq = iter(seq)
 
-    for item in seq:
-        if len(group) >= size:
-            yield group
-            group = []
-        group.append(item)
+    if size < 8:
+        # For small sizes, zipping the same iterator with itself `size` times is faster than
+        # slicing since it avoids an islice() call per group. Only the final group can be padded
+        # with the fill value. Larger sizes aren't zipped since every group, including a short
+        # final one, would allocate `size`-length tuples.
+        for group in itertools.zip_longest(*[seq] * size, fillvalue=Sentinel):
+            if group[-1] is Sentinel:
+                group = [item for item in group if item is not Sentinel]
+                if group:
+                    yield group
+                return
+            yield list(group)
+        return
+
+    group = list(itertools.islice(seq, size))
 
-    if group:
+    while group:
         yield group
+        group = list(itertools.islice(seq, size))
 
 
 def compact(seq):
@@ -65,9 +75,7 @@ def compact(seq):
     Yields:
         Elements that are truthy.
     """
-    for item in seq:
-        if item:
-            yield item
+    return _filter(None, seq)
 
 
 def concat(*seqs):
@@ -110,6 +118,11 @@ def countby(iteratee, seq):
     Returns:
         dict
     """
+    if iteratee is None:
+        # Count the elements themselves without an identity call per element. They're passed as an
+        # iterator so that Counter doesn't treat a mapping `seq` as existing counts.
+        return dict(Counter(iter(seq)))
+
     return dict(Counter(map(iteratee, seq)))
 
 
@@ -139,7 +152,7 @@ def difference(seq, *seqs):
     yield from differenceby(None, seq, *seqs)
 
 
-def differenceby(iteratee, seq, *seqs):
+def differenceby(iteratee, seq, *seqs):  # noqa: C901
     """
     Like :func:`difference` except that an `iteratee` is used to modify each element in the
     sequences. The modified values are then used for comparison.
@@ -174,20 +187,42 @@ def differenceby(iteratee, seq, *seqs):
     # computed value only needs to be done once for each item since that is what we'll
     # compare to below. We'll store these values into a iterable in case any of the
     # sequences are a generator/iterator that would get exhausted if we tried to iterate
-    # over it more than once.
-    others = Container(map(iteratee, concat(*seqs)))
-
-    for item in seq:
-        if iteratee is not None:
-            value = iteratee(item)
-        else:
-            value = item
+    # over it more than once. Hashable values go into a frozenset so that membership is checked
+    # directly instead of through Container.
+    others = list(map(iteratee, concat(*seqs)))
 
-        if value in yielded or value in others:
-            continue
+    if not others:
+        # Nothing to exclude so this is just the unique elements of seq.
+        yield from unionby(iteratee, seq)
+        return
 
-        yield item
-        yielded.add(value)
+    try:
+        others = frozenset(others)
+    except TypeError:
+        others = Container(others)
+
+    # The loops are split on whether there's an iteratee so that it isn't checked per item. A
+    # TypeError from the membership check means an unhashable value was looked up in the frozenset
+    # of hashable values so it can't be in there.
+    if iteratee is None:
+        for item in seq:
+            try:
+                if item in others:
+                    continue
+            except TypeError:
+                pass
+            if yielded.add(item):
+                yield item
+    else:
+        for item in seq:
+            value = iteratee(item)
+            try:
+                if value in others:
+                    continue
+            except TypeError:
+                pass
+            if yielded.add(value):
+                yield item
 
 
 def duplicates(seq, *seqs):
@@ -214,7 +249,7 @@ def duplicates(seq, *seqs):
     yield from duplicatesby(None, seq, *seqs)
 
 
-def duplicatesby(iteratee, seq, *seqs):
+def duplicatesby(iteratee, seq, *seqs):  # noqa: C901
     """
     Like :func:`duplicates` except that an `iteratee` is used to modify each element in the
     sequences. The modified values are then used for comparison.
@@ -236,20 +271,38 @@ def duplicatesby(iteratee, seq, *seqs):
 
     seen = Container()
     yielded = Container()
-
-    for item in itertools.chain(seq, *seqs):
-        if iteratee is not None:
+    # Check and add hashable values directly against the containers' sets and only go through
+    # Container.add() for unhashable values.
+    seen_hashable = seen.hashable
+    yielded_hashable = yielded.hashable
+
+    if iteratee is None:
+        for item in itertools.chain(seq, *seqs):
+            try:
+                if item not in seen_hashable:
+                    seen_hashable.add(item)
+                    continue
+                if item in yielded_hashable:
+                    continue
+                yielded_hashable.add(item)
+            except TypeError:
+                if seen.add(item) or not yielded.add(item):
+                    continue
+            yield item
+    else:
+        for item in itertools.chain(seq, *seqs):
             value = iteratee(item)
-        else:
-            value = item
-
-        if value not in seen:
-            seen.add(value)
-            continue
-
-        if value not in yielded:
+            try:
+                if value not in seen_hashable:
+                    seen_hashable.add(value)
+                    continue
+                if value in yielded_hashable:
+                    continue
+                yielded_hashable.add(value)
+            except TypeError:
+                if seen.add(value) or not yielded.add(value):
+                    continue
             yield item
-            yielded.add(value)
 
 
 def filter(iteratee, seq):
@@ -300,8 +353,7 @@ def find(iteratee, seq):
     Returns:
         First element found or ``None``.
     """
-    for item in filter(iteratee, seq):
-        return item
+    return next(filter(iteratee, seq), None)
 
 
 def findindex(iteratee, seq):
@@ -346,7 +398,16 @@ def findlast(iteratee, seq):
     Returns:
         Last element found or ``None``.
     """
-    return find(iteratee, reversed(seq))
+    if isinstance(seq, Sequence):
+        return find(iteratee, reversed(seq))
+
+    # Iterables that can't be reversed are scanned forward while holding onto the last match.
+    iteratee = fnc.iteratee(iteratee)
+    found = None
+    for value in seq:
+        if iteratee(value):
+            found = value
+    return found
 
 
 def findlastindex(iteratee, seq):
@@ -368,7 +429,20 @@ def findlastindex(iteratee, seq):
         int: Index of found item or ``-1`` if not found.
     """
     iteratee = fnc.iteratee(iteratee)
-    return next((i for i, value in reversed(tuple(enumerate(seq))) if iteratee(value)), -1)
+
+    if isinstance(seq, Sequence):
+        return next(
+            (i for i, value in zip(range(len(seq) - 1, -1, -1), reversed(seq)) if iteratee(value)),
+            -1,
+        )
+
+    # Iterables that can't be indexed are scanned forward while holding onto the last match's
+    # index instead of copying them into a reversible sequence.
+    found = -1
+    for i, value in enumerate(seq):
+        if iteratee(value):
+            found = i
+    return found
 
 
 def flatten(*seqs):
@@ -412,11 +486,18 @@ def flattendeep(*seqs):
     Yields:
         Flattened elements.
     """
-    for item in itertools.chain.from_iterable(seqs):
-        if iscollection(item):
-            yield from flattendeep(item)
-        else:
+    # Walk nested iterables with an explicit stack of iterators instead of recursing so that each
+    # element is yielded once rather than through a "yield from" chain per nesting level.
+    stack = [itertools.chain.from_iterable(seqs)]
+
+    while stack:
+        for item in stack[-1]:
+            if iscollection(item):
+                stack.append(iter(item))
+                break
             yield item
+        else:
+            stack.pop()
 
 
 def groupall(iteratees, seq):
@@ -465,9 +546,19 @@ def groupall(iteratees, seq):
     if not iteratees:
         return seq
 
+    # Resolve the iteratees once up front instead of again for every group at every level.
+    return _groupall([fnc.iteratee(iteratee) for iteratee in iteratees], seq)
+
+
+def _groupall(iteratees, seq):
     head, *rest = iteratees
+    groups = groupby(head, seq)
+
+    if rest:
+        for key, group in groups.items():
+            groups[key] = _groupall(rest, group)
 
-    return fnc.mapvalues(partial(groupall, rest), groupby(head, seq))
+    return groups
 
 
 def groupby(iteratee, seq):
@@ -490,13 +581,13 @@ def groupby(iteratee, seq):
     Returns:
         dict: Results of grouping by `iteratee`.
     """
-    result = {}
+    result = defaultdict(list)
     iteratee = fnc.iteratee(iteratee)
 
     for item in seq:
-        result.setdefault(iteratee(item), []).append(item)
+        result[iteratee(item)].append(item)
 
-    return result
+    return dict(result)
 
 
 def intercalate(value, seq):
@@ -538,17 +629,18 @@ def interleave(*seqs):
     Yields:
         Elements of the interleaved iterable.
     """
-    queue = deque(iter(seq) for seq in seqs)
-
-    while queue:
-        seq = queue.popleft()
+    active = len(seqs)
+    nexts = itertools.cycle(iter(seq).__next__ for seq in seqs)
 
+    while active:
         try:
-            yield next(seq)
+            for next_item in nexts:
+                yield next_item()
         except StopIteration:
-            pass
-        else:
-            queue.append(seq)
+            # Drop the exhausted iterable (the last one called) by rebuilding the cycle from the
+            # remaining ones which, conveniently, are next in line.
+            active -= 1
+            nexts = itertools.cycle(itertools.islice(nexts, active))
 
 
 def intersection(seq, *seqs):
@@ -575,7 +667,7 @@ def intersection(seq, *seqs):
     yield from intersectionby(None, seq, *seqs)
 
 
-def intersectionby(iteratee, seq, *seqs):
+def intersectionby(iteratee, seq, *seqs):  # noqa: C901
     """
     Like :func:`intersection` except that an `iteratee` is used to modify each element in the
     sequences. The modified values are then used for comparison.
@@ -609,26 +701,49 @@ def intersectionby(iteratee, seq, *seqs):
         iteratee = fnc.iteratee(iteratee)
 
     yielded = Container()
+    # Materialize any generators/iterators so that the other sequences can be sized and re-read
+    # if the hashable fast path below has to fall back.
+    seqs = sorted((other if isinstance(other, Sized) else tuple(other) for other in seqs), key=len)
+
     # Map iteratee to each item in each other sequence and compute intersection of those
     # values to reduce number of times iteratee is called. The resulting sequence will
     # be an intersection of computed values which will be used to compare to the primary
-    # sequence. We'll store these values into a iterable in case any of the sequences
-    # are a generator/iterator that would get exhausted if we tried to iterate over it
-    # more than once.
-    others = Container(intersection(*(map(iteratee, other) for other in seqs)))
+    # sequence. When the values are hashable, this is a set seeded from the smallest sequence
+    # that's narrowed down by the rest until nothing is left to match.
+    try:
+        others = set(map(iteratee, seqs[0]))
+        for other in seqs[1:]:
+            if not others:
+                break
+            others.intersection_update(map(iteratee, other))
+    except TypeError:
+        others = Container(intersection(*(map(iteratee, other) for other in seqs)))
+
+    if not others:
+        # Nothing can intersect so there's no need to go through seq.
+        return
 
-    for item in seq:
-        if iteratee is not None:
+    # A TypeError from the membership check means an unhashable value was looked up in the set of
+    # hashable values so it can't be in there.
+    if iteratee is None:
+        for item in seq:
+            try:
+                if item not in others:
+                    continue
+            except TypeError:
+                continue
+            if yielded.add(item):
+                yield item
+    else:
+        for item in seq:
             value = iteratee(item)
-        else:
-            value = item
-
-        if value in yielded:
-            continue
-
-        if value in others:
-            yield item
-            yielded.add(value)
+            try:
+                if value not in others:
+                    continue
+            except TypeError:
+                continue
+            if yielded.add(value):
+                yield item
 
 
 def intersperse(value, seq):
@@ -647,12 +762,13 @@ def intersperse(value, seq):
         Elements of the interspersed iterable.
     """
     seq = iter(seq)
+    first = next(seq, Sentinel)
 
-    try:
-        yield next(seq)
-    except StopIteration:
+    if first is Sentinel:
         return
 
+    yield first
+
     for item in seq:
         yield value
         yield item
@@ -727,7 +843,7 @@ def mapcat(iteratee, *seqs):
     Yields:
         Elements resulting from concat + map operations.
     """
-    return concat(*map(iteratee, *seqs))
+    return itertools.chain.from_iterable(map(iteratee, *seqs))
 
 
 def mapflat(iteratee, *seqs):
@@ -817,8 +933,7 @@ def reject(iteratee, seq):
     Yields:
         Rejected elements.
     """
-    iteratee = fnc.iteratee(iteratee)
-    return filter(fnc.compose(iteratee, not_), seq)
+    return itertools.filterfalse(fnc.iteratee(iteratee), seq)
 
 
 def union(seq, *seqs):
@@ -845,7 +960,7 @@ def union(seq, *seqs):
     yield from unionby(None, seq, *seqs)
 
 
-def unionby(iteratee, seq, *seqs):
+def unionby(iteratee, seq, *seqs):  # noqa: C901
     """
     Like :func:`union` except that an `iteratee` is used to modify each element in the sequences.
     The modified values are then used for comparison.
@@ -873,18 +988,32 @@ def unionby(iteratee, seq, *seqs):
         iteratee = fnc.iteratee(iteratee)
 
     seen = Container()
-
-    for item in itertools.chain(seq, *seqs):
-        if iteratee is not None:
+    # Check and add hashable values directly against the container's set and only go through
+    # Container.add() for unhashable values.
+    hashable = seen.hashable
+
+    if iteratee is None:
+        for item in itertools.chain(seq, *seqs):
+            try:
+                if item in hashable:
+                    continue
+                hashable.add(item)
+            except TypeError:
+                if not seen.add(item):
+                    continue
+            yield item
+    else:
+        for item in itertools.chain(seq, *seqs):
             value = iteratee(item)
-        else:
-            value = item
-
-        if value not in seen:
+            try:
+                if value in hashable:
+                    continue
+                hashable.add(value)
+            except TypeError:
+                if not seen.add(value):
+                    continue
             yield item
 
-        seen.add(value)
-
 
 def unzip(seq):
     """
@@ -921,6 +1050,26 @@ def without(values, seq):
     Yields:
         Elements not in `values`.
     """
+    if isgenerator(values):
+        values = tuple(values)
+
+    if isinstance(values, (list, tuple)):
+        # Promote hashable values to a set so that each membership check is constant time.
+        try:
+            values = frozenset(values)
+        except TypeError:
+            pass
+        else:
+            for item in seq:
+                try:
+                    if item in values:
+                        continue
+                except TypeError:
+                    # Unhashable items can't be in the promoted set of hashable values.
+                    pass
+                yield item
+            return
+
     for item in seq:
         if item not in values:
             yield item
@@ -956,16 +1105,23 @@ def xor(seq, *seqs):
         yield from seq
         return
 
-    head, *rest = seqs
-
-    if isgenerator(seq):
-        seq = tuple(seq)
+    # Generators are materialized since they may need to be iterated over twice if the fast path
+    # below fails.
+    seqs = [tuple(other) if isgenerator(other) else other for other in (seq, *seqs)]
 
-    if isgenerator(head):
-        head = tuple(head)
-
-    a = union(seq, head)
-    b = tuple(intersection(seq, head))
-    d = difference(a, b)
-
-    yield from xor(d, *rest)
+    try:
+        # When all values are hashable, the symmetric difference can be computed in a single pass
+        # by toggling each unique value of each iterable in or out of an insertion-ordered dict.
+        result = {}
+        for other in seqs:
+            for item in dict.fromkeys(other):
+                if item in result:
+                    del result[item]
+                else:
+                    result[item] = None
+    except TypeError:
+        result, *seqs = seqs
+        for other in seqs:
+            result = tuple(difference(union(result, other), tuple(intersection(result, other))))
+
+    yield from result
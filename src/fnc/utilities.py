@@ -1,10 +1,11 @@
 """General utility functions."""
 
 from collections.abc import Iterable
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 from random import randint, uniform
 import re
 import time
+import types
 
 import fnc
 
@@ -21,6 +22,11 @@ RE_PATH_KEY_DELIM = re.compile(r"(?<!\\)\.|(\[.*?\])")
 # Matches on path strings like "[<key>]".
 RE_PATH_GET_ITEM = re.compile(r"^\[.*?\]$")
 
+# Common callable types that iteratee() can return as-is.
+CALLABLE_TYPES = frozenset(
+    (types.FunctionType, types.BuiltinFunctionType, types.MethodType, partial)
+)
+
 
 def after(method):
     """
@@ -79,13 +85,28 @@ def aspath(value):
     Returns:
         list: Returns property paths.
     """
+    path = _aspath(value)
+    return path if isinstance(path, list) else list(path)
+
+
+def _aspath(value):
+    # Like aspath() except that path strings are returned as a cached tuple which must not be
+    # mutated. Used internally where the path is only iterated over.
     if isinstance(value, list):
         return value
 
     if not isinstance(value, str):
-        return [value]
+        return (value,)
+
+    return _parse_path(value)
+
 
-    return [_parse_path_token(token) for token in RE_PATH_KEY_DELIM.split(value) if token]
+@lru_cache(maxsize=1024)
+def _parse_path(value):
+    if "[" not in value and "\\" not in value:
+        # Without brackets or escapes, a path is just its dot-delimited keys.
+        return tuple(filter(None, value.split(".")))
+    return tuple(_parse_path_token(token) for token in RE_PATH_KEY_DELIM.split(value) if token)
 
 
 def _parse_path_token(token):
@@ -112,7 +133,8 @@ def atgetter(paths):
     Returns:
         callable: Function like ``f(obj): fnc.at(paths, obj)``.
     """
-    return partial(fnc.at, paths)
+    # Parse each path once instead of on every call.
+    return partial(fnc.at, tuple(aspath(path) for path in paths))
 
 
 def before(method):
@@ -181,11 +203,28 @@ def compose(*funcs):
     """
     funcs = tuple(partial(*func) if isinstance(func, tuple) else func for func in funcs)
 
+    if not funcs:
+        return noop
+
+    # Only the first function receives the original arguments so the rest can be called with the
+    # previous result directly instead of repacking args and kwargs for each call.
+    first, rest = funcs[0], funcs[1:]
+
+    # Composing one or two functions is common enough to skip the loop entirely.
+    if not rest:
+        return first
+    elif len(rest) == 1:
+        (second,) = rest
+
+        def _compose2(*args, **kwargs):
+            return second(first(*args, **kwargs))
+
+        return _compose2
+
     def _compose(*args, **kwargs):
-        result = None
-        for func in funcs:
-            result = func(*args, **kwargs)
-            args, kwargs = (result,), {}
+        result = first(*args, **kwargs)
+        for func in rest:
+            result = func(result)
         return result
 
     return _compose
@@ -211,9 +250,42 @@ def conformance(source):
     if not isinstance(source, dict):  # pragma: no cover
         raise TypeError("source must be a dict")
 
+    if all(not isinstance(key, str) or aspath(key) == [key] for key in source):
+        # None of the keys are deep paths so plain dict targets can be checked with direct key
+        # lookups that only defer to get() on a miss.
+        return _dictconformance(source)
+
     return partial(conforms, source)
 
 
+def _dictconformance(source):
+    get = fnc.get
+
+    def dictconformance(target):
+        if type(target) is not dict:
+            return conforms(source, target)
+
+        for key, value in source.items():
+            target_value = target.get(key, Sentinel)
+
+            if target_value is Sentinel:
+                target_value = get(key, target, default=Sentinel)
+                if target_value is Sentinel:
+                    return False
+
+            if callable(value):
+                target_result = value(target_value)
+            else:
+                target_result = target_value == value
+
+            if not target_result:
+                return False
+
+        return True
+
+    return dictconformance
+
+
 def conforms(source, target):
     """
     Return whether the `target` object conforms to `source` where `source` is a dictionary that
@@ -313,7 +385,9 @@ def iteratee(obj):
     Note:
         In most cases, this function won't need to be called directly since
         other functions that accept an iteratee will call this function
-        internally.
+        internally. However, since the returned function is passed through
+        as-is, it can be used to resolve an iteratee once and reuse it
+        across many calls.
 
     Examples:
         >>> iteratee(lambda a, b: a + b)(1, 2)
@@ -347,8 +421,15 @@ def iteratee(obj):
     Returns:
         callable: Iteratee function.
     """
-    if obj is None:
+    if type(obj) in CALLABLE_TYPES:
+        return obj
+    elif obj is None:
         return identity
+
+    factory = _iteratee_factories.get(type(obj))
+
+    if factory is not None:
+        return factory(obj)
     elif callable(obj):
         return obj
     elif isinstance(obj, dict):
@@ -463,6 +544,10 @@ def pathgetter(path, default=None):
     """
     Creates a function that returns the value at path of a given object.
 
+    Note:
+        Path strings are parsed once when the function is created instead of on every call so
+        this is the preferred way to repeatedly fetch the same path from many objects.
+
     Examples:
         >>> get_data = pathgetter('data')
         >>> get_data({'data': 1})
@@ -478,13 +563,52 @@ def pathgetter(path, default=None):
 
     Args:
         path (object): Path value to fetch from object.
+        default (mixed, optional): Default value to return if path doesn't exist. Defaults to
+            ``None``.
 
     Returns:
-        callable: Function like ``f(obj): fnc.get(path, obj)``.
-    """
+        callable: Function like ``f(obj): fnc.get(path, obj, default=default)``.
+    """
+    if isinstance(path, str):
+        keys = aspath(path)
+        if len(keys) > 1:
+            # Parse deep path strings once instead of on every call.
+            path = keys
+        elif keys == [path]:
+            return _keygetter(path, default)
     return partial(fnc.get, path, default=default)
 
 
+def _keygetter(key, default=None):
+    # Plain dicts are by far the most common target for single key getters so look the key up
+    # directly and only defer to get() on a miss or for other object types.
+    get = fnc.get
+
+    def keygetter(obj):
+        if type(obj) is dict:
+            value = obj.get(key, Sentinel)
+            if value is not Sentinel:
+                return value
+        return get(key, obj, default=default)
+
+    return keygetter
+
+
+# Path string and index iteratees are commonly rebuilt on every call to functions like map() or
+# filter() so memoize them to avoid constructing the same getter over and over.
+_cached_pathgetter = lru_cache(maxsize=1024, typed=True)(pathgetter)
+
+# Same for tuples of paths but only when every path is a plain string or int since equal tuples
+# could otherwise hold paths of different types, e.g. (1,) == (True,).
+_cached_atgetter = lru_cache(maxsize=1024)(atgetter)
+
+
+def _tupleiteratee(paths):
+    if all(type(path) in (str, int) for path in paths):
+        return _cached_atgetter(paths)
+    return atgetter(paths)
+
+
 def pickgetter(keys):
     """
     Creates a function that returns the value at path of a given object.
@@ -503,6 +627,17 @@ def pickgetter(keys):
     return partial(fnc.pick, keys)
 
 
+# Iteratee factories for builtin types which can be looked up by exact type in iteratee() to skip
+# the chain of isinstance() checks. Subclasses still go through those checks.
+_iteratee_factories = {
+    dict: conformance,
+    set: pickgetter,
+    tuple: _tupleiteratee,
+    str: _cached_pathgetter,
+    int: _cached_pathgetter,
+}
+
+
 def random(start=0, stop=1, floating=False):
     """
     Produces a random number between `start` and `stop` (inclusive). If only one argument is
@@ -527,6 +662,10 @@ def random(start=0, stop=1, floating=False):
         >>> isinstance(random(floating=True), float)
         True
     """
+    if floating is not True and type(start) is int and type(stop) is int:
+        # Plain integer bounds are the most common case so skip the float checks for them.
+        return randint(start, stop) if start <= stop else randint(stop, start)
+
     floating = isinstance(start, float) or isinstance(stop, float) or floating is True
 
     if stop < start:
@@ -21,3 +21,15 @@ class IterMappingObject(object):
 
     def __iter__(self):
         return iter(self.mapping.items())
+
+
+class SetSubclass(set):
+    pass
+
+
+class StrSubclass(str):
+    pass
+
+
+class TupleSubclass(tuple):
+    pass
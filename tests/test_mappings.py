@@ -1,8 +1,11 @@
-from collections import defaultdict, namedtuple
+from collections import OrderedDict, UserList, defaultdict, namedtuple
+import gc
+import weakref
 
 import pytest
 
 import fnc
+from fnc.helpers import UNSET
 
 from .helpers import AttrObject, IterMappingObject, KeysGetItemObject
 
@@ -16,6 +19,7 @@ parametrize = pytest.mark.parametrize
         dict(args=([0, 2, 4], ["a", "b", "c", "d", "e"]), expected=("a", "c", "e")),
         dict(args=([0, 2], ["moe", "larry", "curly"]), expected=("moe", "curly")),
         dict(args=(["a", "b"], {"a": 1, "b": 2, "c": 3}), expected=(1, 2)),
+        dict(args=(["a.b", "c", "a.d"], {"a": {"b": 1}, "c": 2}), expected=(1, 2, None)),
     ],
 )
 def test_at(case):
@@ -130,6 +134,17 @@ def test_defaults(case):
         dict(args=([object, object], {object: {object: 1}}), expected=1),
         dict(args=("0.0.0.0.0.0.0.0.0.0", [[[[[[[[[[42]]]]]]]]]]), expected=42),
         dict(args=("1.name", {1: {"name": "John Doe"}}), expected="John Doe"),
+        dict(args=("a.0", {"a": {"0": "str-key"}}), expected="str-key"),
+        dict(args=("a.0", {"a": {0: "int-key"}}), expected="int-key"),
+        dict(args=("a.0", {"a": {"0": "str-key", 0: "int-key"}}), expected="str-key"),
+        dict(args=(" 1", {1: "int-key"}), expected="int-key"),
+        dict(args=("--1", {-1: "int-key"}), expected=None),
+        dict(args=("a.real", {"a": 5}), expected=5),
+        dict(args=("a.b.c", {"a": {"b": None}}), kwargs={"default": 0}, expected=0),
+        dict(args=(-1, [1, 2, 3]), expected=3),
+        dict(args=("-1", [1, 2, 3]), expected=3),
+        dict(args=(-4, [1, 2, 3]), kwargs={"default": 0}, expected=0),
+        dict(args=("3", (1, 2, 3)), kwargs={"default": 0}, expected=0),
     ],
 )
 def test_get(case):
@@ -137,12 +152,27 @@ def test_get(case):
     assert fnc.get(*case["args"], **kwargs) == case["expected"]
 
 
+def test_get__should_raise_when_default_is_unset():
+    with pytest.raises(KeyError):
+        fnc.get("a.b", {"a": {}}, default=UNSET)
+
+
 def test_get__should_not_populate_defaultdict():
     data = defaultdict(list)
     fnc.get("a", data)
     assert data == {}
 
 
+def test_get__should_not_keep_object_types_alive():
+    Obj = type("Obj", (), {"a": 1})
+    ref = weakref.ref(Obj)
+    assert fnc.get("a", Obj()) == 1
+
+    del Obj
+    gc.collect()
+    assert ref() is None
+
+
 @parametrize(
     "case",
     [
@@ -202,6 +232,8 @@ def test_has__should_not_populate_defaultdict():
             expected={1: "a", 2: "b", 3: "c"},
         ),
         dict(args=([1, 2, 3],), expected={1: 0, 2: 1, 3: 2}),
+        dict(args=(OrderedDict([("a", 1), ("b", 2)]),), expected={1: "a", 2: "b"}),
+        dict(args=(UserList([1, 2, 3]),), expected={1: 0, 2: 1, 3: 2}),
     ],
 )
 def test_invert(case):
@@ -273,6 +305,10 @@ def test_merge(case):
         dict(args=([], [1, 2, 3]), expected={0: 1, 1: 2, 2: 3}),
         dict(args=([0], [1, 2, 3]), expected={1: 2, 2: 3}),
         dict(args=([0, 1], [1, 2, 3]), expected={2: 3}),
+        dict(args=([[0], 1], [1, 2, 3]), expected={0: 1, 2: 3}),
+        dict(args=(iter(["a", "c"]), {"a": 1, "b": 2, "c": 3}), expected={"b": 2}),
+        dict(args=(["a", "b", "c"], {"a": 1, "b": 2, "c": 3}), expected={}),
+        dict(args=({"a", "d"}, {"a": 1, "b": 2, "c": 3}), expected={"b": 2, "c": 3}),
     ],
 )
 def test_omit(case):
@@ -288,6 +324,7 @@ def test_omit(case):
         dict(args=([], [1, 2, 3]), expected={}),
         dict(args=([0], [1, 2, 3]), expected={0: 1}),
         dict(args=(["a"], AttrObject(a=1, b=2, c=3)), expected={"a": 1}),
+        dict(args=(["1", "b"], {1: "a", "c": 3}), expected={"1": "a"}),
     ],
 )
 def test_pick(case):
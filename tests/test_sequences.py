@@ -1,4 +1,9 @@
+from collections import deque
+import gc
+import itertools
 import math
+import sys
+import weakref
 
 import pytest
 
@@ -17,6 +22,12 @@ parametrize = pytest.mark.parametrize
         dict(args=(4, [1, 2, 3, 4, 5]), expected=[[1, 2, 3, 4], [5]]),
         dict(args=(5, [1, 2, 3, 4, 5]), expected=[[1, 2, 3, 4, 5]]),
         dict(args=(6, [1, 2, 3, 4, 5]), expected=[[1, 2, 3, 4, 5]]),
+        dict(args=(2, []), expected=[]),
+        dict(args=(2, iter([None, 1, None])), expected=[[None, 1], [None]]),
+        dict(args=(8, range(20)), expected=[list(range(8)), list(range(8, 16)), [16, 17, 18, 19]]),
+        dict(args=(8, []), expected=[]),
+        dict(args=(5_000_000, [1, 2, 3]), expected=[[1, 2, 3]]),
+        dict(args=(10000, iter(range(10))), expected=[list(range(10))]),
     ],
 )
 def test_chunk(case):
@@ -80,6 +91,8 @@ def test_countby(case):
         dict(args=([1, 1, 1, 1], [2, 4], [3, 5, 6]), expected=[1]),
         dict(args=(iter([1, 2, 3, 4]), iter([2, 4]), iter([1, 3, 5, 6])), expected=[]),
         dict(args=(iter([0, 1, 2, 3, 4]), iter([2, 4]), iter([1, 3, 5, 6])), expected=[0]),
+        dict(args=([[1], [2], [3], [2]], [[1]], [[3]]), expected=[[2]]),
+        dict(args=([[1], 2, [1], 3], [2]), expected=[[1], 3]),
     ],
 )
 def test_difference(case):
@@ -97,6 +110,7 @@ def test_difference(case):
             args=(round, [1.5, 2.2, 3.7, 4.2], [2.5, 4.9], [3, 5, 6]),
             expected=[3.7],
         ),
+        dict(args=("a", [{"a": [1]}, {"a": 2}, {"a": [1]}], [{"a": 2}]), expected=[{"a": [1]}]),
     ],
 )
 def test_differenceby(case):
@@ -113,6 +127,7 @@ def test_differenceby(case):
             args=(iter([1, 2]), iter([3, 2]), iter([1, 5]), iter([6, 5, 5, 5])),
             expected=[2, 1, 5],
         ),
+        dict(args=([[1], 2, [1], [2], 2, [1]],), expected=[[1], 2]),
     ],
 )
 def test_duplicates(case):
@@ -150,6 +165,10 @@ def test_duplicates(case):
             ),
             expected=[2.3, 5.2],
         ),
+        dict(
+            args=("a", [{"a": [1]}, {"a": 2}, {"a": [1]}, {"a": [1]}]),
+            expected=[{"a": [1]}],
+        ),
     ],
 )
 def test_duplicatesby(case):
@@ -272,7 +291,14 @@ def test_findindex(case):
     assert fnc.findindex(*case["args"]) == case["expected"]
 
 
-@parametrize("case", [dict(args=(lambda num: num % 2 == 1, [1, 2, 3, 4]), expected=3)])
+@parametrize(
+    "case",
+    [
+        dict(args=(lambda num: num % 2 == 1, [1, 2, 3, 4]), expected=3),
+        dict(args=(lambda num: num % 2 == 1, iter([1, 2, 3, 4])), expected=3),
+        dict(args=(lambda num: num > 4, iter([1, 2, 3, 4])), expected=None),
+    ],
+)
 def test_findlast(case):
     assert fnc.findlast(*case["args"]) == case["expected"]
 
@@ -296,6 +322,14 @@ def test_findlast(case):
             expected=1,
         ),
         dict(args=(lambda *_: False, ["apple", "banana", "beet"]), expected=-1),
+        dict(
+            args=(lambda item: item.startswith("b"), iter(["apple", "banana", "beet"])), expected=2
+        ),
+        dict(args=(lambda *_: False, iter(["apple", "banana", "beet"])), expected=-1),
+        dict(
+            args=(lambda item: item.startswith("a"), deque(["apple", "banana", "beet"])),
+            expected=0,
+        ),
     ],
 )
 def test_findlastindex(case):
@@ -315,6 +349,16 @@ def test_flatten(case):
     assert list(fnc.flatten(*case["args"])) == case["expected"]
 
 
+def test_flatten__should_not_keep_item_types_alive():
+    Items = type("Items", (list,), {})
+    ref = weakref.ref(Items)
+    assert list(fnc.flatten([Items([1, 2]), 3])) == [1, 2, 3]
+
+    del Items
+    gc.collect()
+    assert ref() is None
+
+
 @parametrize(
     "case",
     [dict(args=([1, ["2222"], [3, [[4]]]], [[[[5]]]]), expected=[1, "2222", 3, 4, 5])],
@@ -323,6 +367,13 @@ def test_flattendeep(case):
     assert list(fnc.flattendeep(*case["args"])) == case["expected"]
 
 
+def test_flattendeep__should_not_be_limited_by_recursion_depth():
+    seq = [1]
+    for _ in range(sys.getrecursionlimit() * 2):
+        seq = [seq, 2]
+    assert list(fnc.flattendeep(seq)) == [1] + [2] * sys.getrecursionlimit() * 2
+
+
 @parametrize(
     "case",
     [
@@ -461,6 +512,9 @@ def test_intercalate(case):
         dict(args=([1, 2], [3, 4], [5, 6]), expected=[1, 3, 5, 2, 4, 6]),
         dict(args=([1, 2], [3, 4, 5], [6]), expected=[1, 3, 6, 2, 4, 5]),
         dict(args=([1, 2, 3], [4], [5, 6]), expected=[1, 4, 5, 2, 6, 3]),
+        dict(args=([], [1, 2], [], [3]), expected=[1, 3, 2]),
+        dict(args=(iter([1, 2]), (3, 4, 5)), expected=[1, 3, 2, 4, 5]),
+        dict(args=(), expected=[]),
     ],
 )
 def test_interleave(case):
@@ -480,6 +534,9 @@ def test_interleave(case):
         dict(args=[iter([2, 1]), iter([1, 2])], expected=[2, 1]),
         dict(args=[iter([2, 1]), iter([1, 2]), iter([0, 1, 2]), iter([1])], expected=[1]),
         dict(args=[iter([1, 2]), iter([2, 1]), iter([0, 1, 2]), iter([1])], expected=[1]),
+        dict(args=([1, 2, 3], [3, 2, 1], [4], [1, 2]), expected=[]),
+        dict(args=([[1], [2], 3], iter([[2], 3, [1]]), [[2], [1]]), expected=[[1], [2]]),
+        dict(args=([[1], 2], {2: "a"}), expected=[2]),
     ],
 )
 def test_intersection(case):
@@ -502,6 +559,7 @@ def test_intersection(case):
             args=(lambda x: round(x), [1.5, 1.7, 2.1, 2.8], [1, 1, 2, 2]),
             expected=[1.5],
         ),
+        dict(args=("a", [{"a": [1]}, {"a": 2}, {"a": 2}], [{"a": 2}]), expected=[{"a": 2}]),
     ],
 )
 def test_intersectionby(case):
@@ -622,6 +680,11 @@ def test_mapcat(case):
     assert list(fnc.mapcat(*case["args"])) == case["expected"]
 
 
+def test_mapcat__should_be_lazy():
+    result = fnc.mapcat(lambda x: [x, x], itertools.count())
+    assert list(itertools.islice(result, 5)) == [0, 0, 1, 1, 2]
+
+
 @parametrize(
     "case",
     [
@@ -756,6 +819,10 @@ def test_union(case):
             args=(lambda x: round(x["a"]), [dict(a=1.7), dict(a=2), dict(a=1)]),
             expected=[dict(a=1.7), dict(a=1)],
         ),
+        dict(
+            args=("a", [dict(a=[1]), dict(a=2)], [dict(a=[1]), dict(a=[2])]),
+            expected=[dict(a=[1]), dict(a=2), dict(a=[2])],
+        ),
     ],
 )
 def test_unionby(case):
@@ -775,16 +842,42 @@ def test_unzip(case):
     assert list(fnc.unzip(*case["args"])) == case["expected"]
 
 
-@parametrize("case", [dict(args=([0, 1], [1, 2, 1, 0, 3, 1, 4]), expected=[2, 3, 4])])
+@parametrize(
+    "case",
+    [
+        dict(args=([0, 1], [1, 2, 1, 0, 3, 1, 4]), expected=[2, 3, 4]),
+        dict(args=((0, 1), [1, [2], 1, 0, {3: 3}]), expected=[[2], {3: 3}]),
+        dict(args=([[0], 1], [1, [2], 1, [0], 3]), expected=[[2], 3]),
+        dict(args=(iter([0, 1]), [1, 2, 1, 0, 3, 1, 4]), expected=[2, 3, 4]),
+        dict(args=({0, 1}, [1, 2, 1, 0, 3, 1, 4]), expected=[2, 3, 4]),
+        dict(args=("abc", ["a", "bc", "d"]), expected=["d"]),
+    ],
+)
 def test_without(case):
     assert list(fnc.without(*case["args"])) == case["expected"]
 
 
+@parametrize(
+    "case",
+    [
+        dict(args=("abc", [1, "a"])),
+        dict(args=({1}, [[1], 2])),
+    ],
+)
+def test_without__should_not_hide_membership_errors_of_values(case):
+    with pytest.raises(TypeError):
+        list(fnc.without(*case["args"]))
+
+
 @parametrize(
     "case",
     [
         dict(args=([1, 2, 3], [5, 2, 1, 4]), expected=[3, 5, 4]),
         dict(args=([1, 2, 5], [2, 3, 5], [3, 4, 5]), expected=[1, 4, 5]),
+        dict(args=([1, 2, 3],), expected=[1, 2, 3]),
+        dict(args=([1, 1, 2], [2, 3], [2]), expected=[1, 3, 2]),
+        dict(args=([1], [1], [1]), expected=[1]),
+        dict(args=([[1], [2]], [[2], [3]], [[2]]), expected=[[1], [3], [2]]),
         dict(args=(iter([1, 2, 5]), iter([2, 3, 5]), iter([3, 4, 5])), expected=[1, 4, 5]),
         dict(
             args=(
@@ -1,9 +1,12 @@
+from collections import OrderedDict, defaultdict
 from unittest import mock
 
 import pytest
 
 import fnc
 
+from .helpers import SetSubclass, StrSubclass, TupleSubclass
+
 
 parametrize = pytest.mark.parametrize
 
@@ -40,12 +43,22 @@ def test_aspath(case):
     assert fnc.aspath(*case["args"]) == case["expected"]
 
 
+def test_aspath__should_return_new_list_for_cached_path_strings():
+    path = fnc.aspath("a.b.c")
+    path.append("d")
+    assert fnc.aspath("a.b.c") == ["a", "b", "c"]
+
+
 @parametrize(
     "case",
     [
         dict(args=([0, 2, 4], ["a", "b", "c", "d", "e"]), expected=("a", "c", "e")),
         dict(args=([0, 2], ["moe", "larry", "curly"]), expected=("moe", "curly")),
         dict(args=(["a", "b"], {"a": 1, "b": 2, "c": 3}), expected=(1, 2)),
+        dict(
+            args=(iter(["a.b", ["c", "d"], "e[0]"]), {"a": {"b": 1}, "c": {"d": 2}, "e": [3]}),
+            expected=(1, 2, 3),
+        ),
     ],
 )
 def test_atgetter(case):
@@ -76,6 +89,8 @@ def test_before():
             expected="Hi !!!Bob!!!",
         ),
         dict(funcs=(lambda x: x + x, lambda x: x * x), args=(5,), expected=100),
+        dict(funcs=(), args=(5,), expected=None),
+        dict(funcs=(lambda x, y=1: x * y,), args=(5,), kwargs={"y": 2}, expected=10),
         dict(
             funcs=((fnc.map, tuple), (fnc.map, list), tuple),
             args=([{"a": 1}, {"b": 2}, {"c": 3}],),
@@ -89,7 +104,8 @@ def test_before():
     ],
 )
 def test_compose(case):
-    assert fnc.compose(*case["funcs"])(*case["args"]) == case["expected"]
+    kwargs = case.get("kwargs", {})
+    assert fnc.compose(*case["funcs"])(*case["args"], **kwargs) == case["expected"]
 
 
 @parametrize(
@@ -102,6 +118,12 @@ def test_compose(case):
         ),
         dict(args=({}, {}), expected=True),
         dict(args=({}, {"a": 1}), expected=True),
+        dict(args=({"0": "a"}, {0: "a"}), expected=True),
+        dict(args=({"a": lambda a: a > 1}, {"a": 2}), expected=True),
+        dict(args=({"a": lambda a: a > 1}, {"a": 1}), expected=False),
+        dict(args=({"a.b": 1}, {"a": {"b": 1}}), expected=True),
+        dict(args=({"real": 1}, 1), expected=True),
+        dict(args=({"a": 1}, defaultdict(int)), expected=False),
     ],
 )
 def test_conformance(case):
@@ -167,6 +189,10 @@ def test_identity(case):
         dict(args=("a", {"a": 1, "b": 2}), expected=1),
         dict(args=("a.b", {"a": {"b": 2}}), expected=2),
         dict(args=(["a", "b"], {"a": {"b": 2}}), expected=2),
+        dict(args=(OrderedDict(a=1), {"a": 1, "b": 2}), expected=True),
+        dict(args=(SetSubclass({"a"}), {"a": 1, "b": 2}), expected={"a": 1}),
+        dict(args=(TupleSubclass(("a", "b")), {"a": 1, "b": 2}), expected=(1, 2)),
+        dict(args=(StrSubclass("a.b"), {"a": {"b": 2}}), expected=2),
     ],
 )
 def test_iteratee(case):
@@ -174,6 +200,16 @@ def test_iteratee(case):
     assert fnc.iteratee(args[0])(*args[1:]) == case["expected"]
 
 
+def test_iteratee__should_reuse_path_string_getters():
+    assert fnc.iteratee("a.b") is fnc.iteratee("a.b")
+    assert fnc.iteratee("a.b")({"a": {"b": 1}}) == 1
+    assert fnc.iteratee(1) is fnc.iteratee(1)
+    assert fnc.iteratee(1) is not fnc.iteratee(True)
+    assert fnc.iteratee(("a", 0)) is fnc.iteratee(("a", 0))
+    assert fnc.iteratee(("a", 1)) is not fnc.iteratee(("a", True))
+    assert fnc.iteratee(("a", True))({"a": 1, True: 2}) == (1, 2)
+
+
 @parametrize(
     "case",
     [dict(args=(lambda item: item, True)), dict(args=(lambda item: item, False))],
@@ -236,6 +272,12 @@ def test_overany(case):
             kwargs={"default": []},
             expected=[],
         ),
+        dict(args=("one", {"one": None}), kwargs={"default": 1}, expected=None),
+        dict(args=("two", {"one": 1}), kwargs={"default": 2}, expected=2),
+        dict(args=("0", {0: "a"}), expected="a"),
+        dict(args=("1", [1, 2]), expected=2),
+        dict(args=("real", 1), expected=1),
+        dict(args=("one", defaultdict(list)), expected=None),
     ],
 )
 def test_pathgetter(case):
@@ -263,6 +305,8 @@ def test_pickgetter(case):
         dict(args=(), expected={"type": int, "min": 0, "max": 1}),
         dict(args=(25,), expected={"type": int, "min": 0, "max": 25}),
         dict(args=(5, 10), expected={"type": int, "min": 5, "max": 10}),
+        dict(args=(10, 5), expected={"type": int, "min": 5, "max": 10}),
+        dict(args=(True, 5), expected={"type": int, "min": 1, "max": 5}),
         dict(
             args=(),
             kwargs={"floating": True},